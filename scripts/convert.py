@@ -11,6 +11,8 @@ from typing import Any
 
 import orjson
 
+LANG_WHITESPACE: str = " \t\r\n\f\v"
+
 
 def clean_lang_content(raw_content: str) -> str:
     """Clean and normalize language file content.
@@ -22,41 +24,47 @@ def clean_lang_content(raw_content: str) -> str:
         str: The cleaned and normalized content.
     """
     cleaned_content = raw_content.replace("\ufeff", "").replace("\r\n", "\n").replace("\r", "\n")
-    cleaned_content = "\n".join(
-        line for line in cleaned_content.splitlines() if line.strip(" \t\r\n\f\v")
-    )
-    return remove_duplicate_keys(cleaned_content) if cleaned_content.strip() else ""
+    lines = [line for line in cleaned_content.splitlines() if line.strip(LANG_WHITESPACE)]
+    cleaned_content = "\n".join(_remove_duplicate_key_lines(lines))
+    return cleaned_content if cleaned_content.strip() else ""
 
 
-def remove_duplicate_keys(lang_content: str) -> str:
-    """Remove duplicate keys from lang file content, keeping first occurrence.
+def _remove_duplicate_key_lines(lines: list[str]) -> list[str]:
+    """Drop lines whose key has already been seen, keeping first occurrence.
 
     Args:
-        lang_content (str): The content of the .lang file as a string.
+        lines (list[str]): The lines of a .lang file.
 
     Returns:
-        str: The cleaned .lang file content with duplicates removed.
+        list[str]: The lines with duplicate keys removed.
     """
     seen_keys: set[str] = set()
     result_lines: list[str] = []
+    append = result_lines.append
+
+    for line in lines:
+        key, separator, _ = line.partition("=")
+        if separator:
+            key = key.strip()
+            if key and not key.startswith("##"):
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+        append(line)
 
-    for line in lang_content.splitlines():
-        trimmed_line = line.strip()
+    return result_lines
 
-        if not trimmed_line or trimmed_line.startswith("##"):
-            result_lines.append(line)
-            continue
 
-        equal_index = trimmed_line.find("=")
-        if equal_index > 0:
-            key = trimmed_line[:equal_index].strip()
-            if key not in seen_keys:
-                seen_keys.add(key)
-                result_lines.append(line)
-        else:
-            result_lines.append(line)
+def remove_duplicate_keys(lang_content: str) -> str:
+    """Remove duplicate keys from lang file content, keeping first occurrence.
 
-    return "\n".join(result_lines)
+    Args:
+        lang_content (str): The content of the .lang file as a string.
+
+    Returns:
+        str: The cleaned .lang file content with duplicates removed.
+    """
+    return "\n".join(_remove_duplicate_key_lines(lang_content.splitlines()))
 
 
 def convert_lang_to_json(lang_content: str) -> OrderedDict[str, str]:
@@ -69,24 +77,28 @@ def convert_lang_to_json(lang_content: str) -> OrderedDict[str, str]:
         OrderedDict: An ordered dictionary with keys and values from the .lang file.
     """
     json_data: OrderedDict[str, str] = OrderedDict()
+    whitespace = LANG_WHITESPACE
 
     for line in lang_content.splitlines():
-        line = line.strip(" \t\r\n\f\v")
+        line = line.strip(whitespace)
 
         if not line or line.startswith("##"):
             continue
 
-        equal_index = line.find("=")
-        if equal_index > 0:
-            key = line[:equal_index].strip()
-            value = line[equal_index + 1 :].strip(" \t\r\n\f\v")
+        key, separator, value = line.partition("=")
+        if not separator or not key:
+            continue
+
+        key = key.strip()
+        if key in json_data:
+            continue
 
-            tab_hash_index = value.find("\t#")
-            if tab_hash_index != -1:
-                value = value[:tab_hash_index].rstrip(" \t\r\n\f\v")
+        value = value.strip(whitespace)
+        tab_hash_index = value.find("\t#")
+        if tab_hash_index != -1:
+            value = value[:tab_hash_index].rstrip(whitespace)
 
-            if key not in json_data:
-                json_data[key] = value
+        json_data[key] = value
 
     return json_data
 
@@ -129,8 +141,7 @@ def load_json_file(file_path: Path) -> dict[str, Any]:
     Returns:
         dict: The loaded JSON data.
     """
-    with file_path.open("r", encoding="utf-8") as f:
-        return orjson.loads(f.read())
+    return orjson.loads(file_path.read_bytes())
 
 
 def load_tsv_file(file_path: Path) -> dict[str, Any]:
@@ -6,19 +6,28 @@ Supports both UWP (appx) and GDK (msixvc) package formats.
 """
 
 import datetime
+import hashlib
+import html
+import io
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TypedDict
+from typing import BinaryIO, TypedDict
 
 import orjson
 import requests
-from bs4 import BeautifulSoup, Tag
+import urllib3
 from convert import clean_lang_content, convert_lang_to_json
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class PackageInfo(TypedDict):
@@ -40,6 +49,62 @@ PACKAGE_INFO: list[PackageInfo] = [
 
 TARGET_LANGUAGES: list[str] = ["en_US.lang", "zh_CN.lang", "zh_TW.lang"]
 
+DOWNLOAD_CHUNK_SIZE: int = 1 << 20
+
+DOWNLOAD_SEGMENTS: int = 4
+
+SEGMENTED_DOWNLOAD_MIN_SIZE: int = 64 << 20
+
+ANCHOR_PATTERN: re.Pattern[str] = re.compile(
+    r"""<a\s[^>]*?\bhref\s*=\s*["']([^"']+)["'][^>]*>(.*?)</a\s*>""", re.IGNORECASE | re.DOTALL
+)
+
+HTML_TAG_PATTERN: re.Pattern[str] = re.compile(r"<[^>]*>")
+
+APPX_X64_PATTERN: re.Pattern[str] = re.compile(r"x64.*\.appx\b")
+
+JSON_CACHE_DIR_NAME: str = ".cache"
+
+JSON_CACHE_MAX_AGE: datetime.timedelta = datetime.timedelta(days=30)
+
+CONVERTER_DIGEST: bytes = hashlib.blake2b(
+    Path(__file__).with_name("convert.py").read_bytes(), digest_size=16
+).digest()
+
+EXTRACTED_VERSION_FILE_NAME: str = ".extracted_version"
+
+JSON_OPTIONS: int = orjson.OPT_APPEND_NEWLINE | (
+    orjson.OPT_INDENT_2 if os.getenv("PRETTY_JSON") == "1" else 0
+)
+
+RESOURCE_PACKS_PREFIX: str = "data/resource_packs/"
+
+_LINK_CACHE: dict[str, list[tuple[str, str]]] = {}
+
+_ACTIVE_DOWNLOADS: set[Path] = set()
+
+_WRITE_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="lang-writer"
+)
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session with connection pooling and retries.
+
+    Returns:
+        requests.Session: Session shared by all requests of this script
+    """
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION: requests.Session = _create_session()
+
 
 class VersionData(TypedDict):
     """Version data from bedrock.json API.
@@ -80,7 +145,7 @@ def get_latest_version_from_api(package_type: str) -> tuple[str, str, str] | Non
             "Accept-Language": "en-US,en;q=0.9",
             "Referer": "https://mcappx.com/",
         }
-        response = requests.get(
+        response = _SESSION.get(
             "https://data.mcappx.com/v2/bedrock.json", headers=headers, timeout=30
         )
         response.raise_for_status()
@@ -88,17 +153,17 @@ def get_latest_version_from_api(package_type: str) -> tuple[str, str, str] | Non
 
         versions_data = data.get("From_mcappx.com", {})
 
-        latest_version: str | None = None
-        latest_data: VersionData | None = None
-        latest_date = ""
-
-        for version, version_data in versions_data.items():
-            if version_data.get("Type") == package_type:
-                version_date = version_data.get("Date", "")
-                if version_date >= latest_date:
-                    latest_date = version_date
-                    latest_version = version
-                    latest_data = version_data
+        # Iterate in reverse so that the last entry wins among equal dates
+        latest: tuple[str, VersionData] | None = max(
+            (
+                (version, version_data)
+                for version, version_data in reversed(versions_data.items())
+                if version_data.get("Type") == package_type
+            ),
+            key=lambda item: item[1].get("Date", ""),
+            default=None,
+        )
+        latest_version, latest_data = latest if latest else (None, None)
 
         if not latest_version or not latest_data:
             print(f"No {package_type} version found in API")
@@ -133,20 +198,22 @@ def get_latest_version_from_api(package_type: str) -> tuple[str, str, str] | Non
         return None
 
 
-def get_appx_file(package_name: str, base_dir: Path) -> Path | None:
-    """Download appx file for the specified package.
+def _fetch_store_links(package_name: str) -> list[tuple[str, str]] | None:
+    """Fetch the download links listed by store.rg-adguard.net for a package.
+
+    Results that contain an x64 appx link are cached per package family name,
+    so repeated lookups within one run skip the request and the HTML parse.
+    Responses without one (e.g. an error page) are not cached, so a retry
+    requests the links again.
 
     Args:
-        package_name (str): The package family name to download
-        base_dir (Path): Base directory to save the downloaded file
+        package_name (str): The package family name to look up
 
     Returns:
-        Path: Path to the downloaded appx file, or None if download failed
-
-    This function uses the store.rg-adguard.net service to obtain download links
-    for Microsoft Store packages, then downloads the x64 appx file.
+        list[tuple[str, str]] | None: (link_text, href) pairs, or None if the request failed
     """
-    print(f"Getting download link for {package_name}...")
+    if package_name in _LINK_CACHE:
+        return _LINK_CACHE[package_name]
 
     url = "https://store.rg-adguard.net/api/GetFiles"
     data = {
@@ -166,24 +233,43 @@ def get_appx_file(package_name: str, base_dir: Path) -> Path | None:
     }
 
     try:
-        response = requests.post(url, data=data, headers=headers, timeout=30)
+        response = _SESSION.post(url, data=data, headers=headers, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error requesting download links: {e}", file=sys.stderr)
         return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    links = [
+        (html.unescape(HTML_TAG_PATTERN.sub("", text)).strip(), html.unescape(href))
+        for href, text in ANCHOR_PATTERN.findall(response.text)
+    ]
 
-    for link in soup.find_all("a", href=True):
-        if not isinstance(link, Tag):
-            continue
+    if any(APPX_X64_PATTERN.search(link_text) for link_text, _ in links):
+        _LINK_CACHE[package_name] = links
+    return links
 
-        link_text = link.get_text(strip=True)
-        if re.search(r"x64.*\.appx\b", link_text):
-            href_value = link.get("href")
-            if not isinstance(href_value, str):
-                continue
 
+def get_appx_file(package_name: str, base_dir: Path) -> Path | None:
+    """Download appx file for the specified package.
+
+    Args:
+        package_name (str): The package family name to download
+        base_dir (Path): Base directory to save the downloaded file
+
+    Returns:
+        Path: Path to the downloaded appx file, or None if download failed
+
+    This function uses the store.rg-adguard.net service to obtain download links
+    for Microsoft Store packages, then downloads the x64 appx file.
+    """
+    print(f"Getting download link for {package_name}...")
+
+    links = _fetch_store_links(package_name)
+    if links is None:
+        return None
+
+    for link_text, href_value in links:
+        if APPX_X64_PATTERN.search(link_text):
             appx_path = base_dir / link_text
             if download_file(href_value, appx_path):
                 return appx_path
@@ -197,6 +283,7 @@ def _process_lang_file(
     zip_file: zipfile.ZipFile,
     entry: zipfile.ZipInfo,
     base_output_dir: Path,
+    relative_path: str,
 ) -> bool:
     """Process a single language file from zip archive.
 
@@ -204,51 +291,134 @@ def _process_lang_file(
         zip_file: Open ZipFile object
         entry: ZipInfo entry for the language file
         base_output_dir: Base output directory for extracted files
+        relative_path: Output path of the file relative to base_output_dir
 
     Returns:
         bool: True if file was successfully processed, False otherwise
     """
-    relative_path = entry.filename.replace("data/resource_packs/", "").replace("/texts/", "/")
-
-    print(f"  Processing: {entry.filename}")
-
-    raw_content = zip_file.read(entry).decode("utf-8", errors="ignore")
+    with (
+        zip_file.open(entry) as raw_stream,
+        io.TextIOWrapper(raw_stream, encoding="utf-8", errors="ignore", newline="") as text_stream,
+    ):
+        raw_content = text_stream.read()
     cleaned_content = clean_lang_content(raw_content)
 
+    processing_message = f"  Processing: {entry.filename}"
+
     if not cleaned_content:
+        print(processing_message)
         return False
 
-    return _save_lang_and_json(cleaned_content, base_output_dir / relative_path, relative_path)
+    return _save_lang_and_json(
+        cleaned_content,
+        base_output_dir / relative_path,
+        relative_path,
+        base_output_dir.parent / JSON_CACHE_DIR_NAME,
+        log_header=processing_message,
+    )
 
 
-def _save_lang_and_json(content: str, output_file: Path, relative_path: str) -> bool:
+def _write_lang_file(output_file: Path, content: str) -> None:
+    """Atomically write cleaned language content to a .lang file.
+
+    Args:
+        output_file: Path to output .lang file
+        content: Cleaned language file content
+    """
+    tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+    tmp_file.write_bytes(content.encode("utf-8"))
+    tmp_file.replace(output_file)
+
+
+def _save_lang_and_json(
+    content: str,
+    output_file: Path,
+    relative_path: str,
+    cache_dir: Path,
+    log_header: str | None = None,
+) -> bool:
     """Save language content to .lang and .json files.
 
+    The JSON conversion is cached in cache_dir, keyed by a hash of the content,
+    the JSON options and the converter source, so unchanged language files are
+    not converted again on later runs. Log messages are written in a single
+    call so that output from concurrent workers does not interleave.
+
     Args:
         content: Cleaned language file content
         output_file: Path to output .lang file
         relative_path: Relative path for display purposes
+        cache_dir: Directory holding previously converted JSON files
+        log_header: Optional line to log before the created file messages
 
     Returns:
         bool: True if files were successfully saved, False otherwise
     """
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    output_file.write_text(content, encoding="utf-8", newline="\n")
-    print(f"Created {relative_path}")
+    lang_write = _WRITE_EXECUTOR.submit(_write_lang_file, output_file, content)
 
-    json_data = convert_lang_to_json(content)
     json_file = output_file.with_suffix(".json")
+    json_relative_path = relative_path.replace(".lang", ".json")
 
-    with json_file.open("wb") as f:
-        f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16)
+    digest.update(JSON_OPTIONS.to_bytes(4, "little"))
+    digest.update(CONVERTER_DIGEST)
+    cached_json_file = cache_dir / f"{digest.hexdigest()}.json"
 
-    json_relative_path = relative_path.replace(".lang", ".json")
-    print(f"Created {json_relative_path} with {len(json_data)} entries")
+    if cached_json_file.exists():
+        shutil.copyfile(cached_json_file, json_file)
+        os.utime(cached_json_file)
+        json_message = f"Created {json_relative_path} from cache"
+    else:
+        json_data = convert_lang_to_json(content)
+        json_bytes = orjson.dumps(json_data, option=JSON_OPTIONS)
+        json_file.write_bytes(json_bytes)
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_dir, delete=False) as tmp_file:
+            tmp_file.write(json_bytes)
+        os.replace(tmp_file.name, cached_json_file)
+        json_message = f"Created {json_relative_path} with {len(json_data)} entries"
+
+    lang_write.result()
+
+    log_lines = [f"Created {relative_path}", json_message]
+    if log_header is not None:
+        log_lines.insert(0, log_header)
+    sys.stdout.write("\n".join(log_lines) + "\n")
 
     return True
 
 
+def _prune_json_cache(cache_dir: Path) -> None:
+    """Remove cached JSON conversions that have not been used recently.
+
+    Args:
+        cache_dir (Path): Directory holding previously converted JSON files
+    """
+    if not cache_dir.exists():
+        return
+
+    cutoff = (datetime.datetime.now() - JSON_CACHE_MAX_AGE).timestamp()
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map usable as a seekable file object by ZipFile."""
+
+    def seekable(self) -> bool:
+        """Report the map as seekable (mmap only gained this method in Python 3.13).
+
+        Returns:
+            bool: Always True
+        """
+        return True
+
+
 def export_files_to_structure(
     zip_path: Path, base_output_dir: Path, target_languages: list[str], exclude_beta: bool = False
 ) -> bool:
@@ -269,32 +439,43 @@ def export_files_to_structure(
     found_any = False
 
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_file:
-            texts_entries = [
-                entry
-                for entry in zip_file.infolist()
-                if entry.filename.startswith("data/resource_packs/")
-                and "/texts/" in entry.filename
-                and entry.filename.endswith(".lang")
-            ]
-            texts_entries.sort(key=lambda x: x.filename)
-
-            for entry in texts_entries:
-                filename = Path(entry.filename).name
-
-                if filename not in target_languages:
-                    continue
+        with (
+            zip_path.open("rb") as zip_stream,
+            _MappedFile(zip_stream.fileno(), 0, access=mmap.ACCESS_READ) as zip_map,
+            zipfile.ZipFile(zip_map, "r") as zip_file,
+        ):
+            wanted = set(target_languages)
+            name_to_info = zip_file.NameToInfo
+            lang_names = sorted(
+                name
+                for name in name_to_info
+                if name.startswith(RESOURCE_PACKS_PREFIX)
+                and name.rpartition("/")[2] in wanted
+                and "/texts/" in name
+            )
 
-                relative_path = entry.filename.replace("data/resource_packs/", "").replace(
-                    "/texts/", "/"
-                )
+            selected_entries: list[tuple[zipfile.ZipInfo, str]] = []
+            for name in lang_names:
+                entry = name_to_info[name]
+                relative_path = name[len(RESOURCE_PACKS_PREFIX) :].replace("/texts/", "/", 1)
 
                 if exclude_beta and "beta/" in relative_path:
                     print(f"  Skipping beta path: {relative_path}")
                     continue
 
-                if _process_lang_file(zip_file, entry, base_output_dir):
-                    found_any = True
+                selected_entries.append((entry, relative_path))
+
+            if not selected_entries:
+                return False
+
+            with ThreadPoolExecutor(max_workers=min(8, len(selected_entries))) as executor:
+                futures = [
+                    executor.submit(
+                        _process_lang_file, zip_file, entry, base_output_dir, relative_path
+                    )
+                    for entry, relative_path in selected_entries
+                ]
+                found_any = any([future.result() for future in futures])
 
     except zipfile.BadZipFile:
         print(f"Error: {zip_path} is not a valid zip file", file=sys.stderr)
@@ -306,49 +487,274 @@ def export_files_to_structure(
     return found_any
 
 
-def _show_download_progress(
-    downloaded_size: int, total_size: int, last_logged: int, is_github_actions: bool
-) -> int:
-    """Show download progress based on environment.
+class _ProgressReporter:
+    """Rate-limited download progress callback.
 
-    Args:
-        downloaded_size: Number of bytes downloaded
-        total_size: Total file size in bytes (0 if unknown)
-        last_logged: Last progress value that was logged
-        is_github_actions: Whether running in GitHub Actions
+    Every call adds to the byte counter, but a progress line is only formatted
+    and printed once the next report threshold has been crossed: every 10% (or
+    50 MB when the size is unknown) as a separate line, every 0.1% (or 1 MB) as
+    an in-place update on a terminal. Separate lines are also used on a terminal
+    while several downloads run at once, so their updates do not overwrite each
+    other; each line then names the file it belongs to.
 
-    Returns:
-        Updated last_logged value
+    Attributes:
+        downloaded_size (int): Number of bytes reported so far
     """
-    downloaded_mb = downloaded_size / 1024 / 1024
 
-    if total_size > 0:
-        progress = (downloaded_size / total_size) * 100
-        total_mb = total_size / 1024 / 1024
+    def __init__(self, total_size: int, is_github_actions: bool, label: str) -> None:
+        """Initialize the reporter.
+
+        Args:
+            total_size: Total file size in bytes (0 if unknown)
+            is_github_actions: Whether running in GitHub Actions
+            label: Name of the file being downloaded
+        """
+        self._total_size = total_size
+        self._total_mb = total_size / 1024 / 1024
+        self._is_github_actions = is_github_actions
+        self._label = label
+        self._line_open = False
+        self.downloaded_size = 0
+
+        if total_size > 0:
+            self._line_step = max(total_size // 10, 1)
+            self._inline_step = max(total_size // 1000, 1)
+            self._next_line_at = 0
+            self._format = self._format_progress
+        else:
+            self._line_step = 50 << 20
+            self._inline_step = 1 << 20
+            self._next_line_at = self._line_step
+            self._format = self._format_downloaded
 
         if is_github_actions:
-            current_step = int(progress // 10)
-            if current_step > last_logged:
-                print(f"  Progress: {progress:.0f}% ({downloaded_mb:.1f}/{total_mb:.1f} MB)")
-                return current_step
+            self._step = self._line_step
+            self._next_report_at = self._next_line_at
         else:
-            progress_text = f"\r  Progress: {progress:.1f}% ({downloaded_mb:.1f}/{total_mb:.1f} MB)"
-            print(progress_text, end="", flush=True)
-    else:
-        if is_github_actions:
-            mb_int = int(downloaded_mb)
-            if mb_int % 50 == 0 and mb_int > last_logged:
-                print(f"  Downloaded: {downloaded_mb:.0f} MB")
-                return mb_int
+            self._step = self._inline_step
+            self._next_report_at = 0
+
+    def __call__(self, n_bytes: int) -> None:
+        """Record downloaded bytes and print progress on threshold crossing.
+
+        Args:
+            n_bytes: Number of bytes downloaded since the last call
+        """
+        self.downloaded_size += n_bytes
+        if self.downloaded_size < self._next_report_at:
+            return
+
+        downloaded_mb = self.downloaded_size / 1024 / 1024
+        if self._is_github_actions or len(_ACTIVE_DOWNLOADS) > 1:
+            if self.downloaded_size >= self._next_line_at:
+                line_break = "\n" if self._line_open else ""
+                progress_text = self._format(downloaded_mb, 0)
+                sys.stdout.write(f"{line_break}  [{self._label}] {progress_text}\n")
+                self._line_open = False
+                self._next_line_at = self._next_threshold(self._line_step)
         else:
-            print(f"\r  Downloaded: {downloaded_mb:.1f} MB", end="", flush=True)
+            sys.stdout.write(f"\r  {self._format(downloaded_mb, 1)}")
+            sys.stdout.flush()
+            self._line_open = True
+
+        self._next_report_at = self._next_threshold(self._step)
+
+    def finish(self) -> None:
+        """End an in-place progress line once the download is complete."""
+        if self._line_open:
+            sys.stdout.write("\n")
+            self._line_open = False
+
+    def _next_threshold(self, step: int) -> int:
+        next_threshold = (self.downloaded_size // step + 1) * step
+        if self.downloaded_size < self._total_size < next_threshold:
+            next_threshold = self._total_size
+        return next_threshold
+
+    def _format_progress(self, downloaded_mb: float, precision: int) -> str:
+        progress = self.downloaded_size / self._total_size * 100
+        return f"Progress: {progress:.{precision}f}% ({downloaded_mb:.1f}/{self._total_mb:.1f} MB)"
+
+    def _format_downloaded(self, downloaded_mb: float, precision: int) -> str:
+        return f"Downloaded: {downloaded_mb:.{precision}f} MB"
+
+
+class _ProgressReader:
+    """Readable wrapper that reports download progress as data is read."""
+
+    def __init__(self, raw: BinaryIO, reporter: _ProgressReporter) -> None:
+        """Initialize the reader.
+
+        Args:
+            raw: Underlying binary stream to read from
+            reporter: Progress callback receiving the size of each chunk read
+        """
+        self._raw = raw
+        self._reporter = reporter
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the underlying stream and report progress.
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            bytes: The data read, empty at end of stream
+        """
+        chunk = self._raw.read(size)
+        if chunk:
+            self._reporter(len(chunk))
+        return chunk
 
-    return last_logged
+
+def _probe_remote_file(url: str, headers: dict[str, str]) -> tuple[str | None, int, bool]:
+    """Fetch the validator, size and range support of a remote file with a HEAD request.
+
+    Args:
+        url (str): URL of the remote file
+        headers (dict[str, str]): Request headers to send
+
+    Returns:
+        tuple[str | None, int, bool]: (ETag or Last-Modified value, content length,
+            whether byte range requests are accepted)
+            The validator is None and the length is 0 when unavailable
+    """
+    try:
+        head = _SESSION.head(url, headers=headers, timeout=30, allow_redirects=True)
+        head.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Warning: HEAD request failed: {e}", file=sys.stderr)
+        return (None, 0, False)
+
+    validator = head.headers.get("ETag") or head.headers.get("Last-Modified")
+    accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+    return (validator, int(head.headers.get("content-length", 0)), accepts_ranges)
+
+
+def _download_segmented(
+    url: str, headers: dict[str, str], output_path: Path, total_size: int
+) -> bool:
+    """Download a file as concurrent HTTP Range segments.
+
+    As soon as one segment fails or the server ignores the Range header, the
+    other segments stop downloading.
+
+    Args:
+        url (str): URL to download from
+        headers (dict[str, str]): Request headers to send
+        output_path (Path): Path to save the downloaded file
+        total_size (int): Size of the remote file in bytes
+
+    Returns:
+        bool: True if download successful, False if the server ignored the Range header
+
+    Raises:
+        requests.RequestException: If a segment request fails or ends early
+    """
+    segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+    segments = [
+        (start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+
+    is_github_actions = bool(os.getenv("GITHUB_ACTIONS"))
+    progress_lock = threading.Lock()
+    reporter = _ProgressReporter(
+        total_size, is_github_actions, output_path.name.removesuffix(".part")
+    )
+
+    def report_progress(size: int) -> None:
+        with progress_lock:
+            reporter(size)
+
+    abort = threading.Event()
+
+    def fetch_segment(start: int, end: int) -> bool:
+        segment_headers = {
+            **headers,
+            "Range": f"bytes={start}-{end}",
+            "Accept-Encoding": "identity",
+        }
+        try:
+            with _SESSION.get(url, stream=True, headers=segment_headers, timeout=60) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    abort.set()
+                    return False
+
+                written = 0
+                with output_path.open("r+b") as f:
+                    f.seek(start)
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if abort.is_set():
+                            return False
+                        f.write(chunk)
+                        written += len(chunk)
+                        report_progress(len(chunk))
+
+            if written != end - start + 1:
+                raise requests.RequestException(f"Incomplete segment: bytes {start}-{end}")
+        except BaseException:
+            abort.set()
+            raise
+
+        return True
+
+    with output_path.open("wb") as f:
+        f.truncate(total_size)
+
+    with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+        futures = [executor.submit(fetch_segment, start, end) for start, end in segments]
+        completed = all([future.result() for future in futures])
+
+    reporter.finish()
+
+    return completed
+
+
+def _save_etag(etag_file: Path, validator: str | None) -> None:
+    """Store the validator of a downloaded file in its sidecar file.
+
+    Args:
+        etag_file (Path): Path of the sidecar file
+        validator (str | None): ETag or Last-Modified value, or None to remove the sidecar
+    """
+    if validator:
+        etag_file.write_text(validator, encoding="utf-8")
+    elif etag_file.exists():
+        etag_file.unlink()
+
+
+def _is_download_current(
+    output_path: Path, etag_file: Path, validator: str | None, remote_size: int
+) -> bool:
+    """Check whether a previously downloaded file matches the remote file.
+
+    Args:
+        output_path (Path): Path of the downloaded file
+        etag_file (Path): Path of the sidecar file storing the validator
+        validator (str | None): Current ETag or Last-Modified value of the remote file
+        remote_size (int): Current content length of the remote file (0 if unknown)
+
+    Returns:
+        bool: True if the local file can be reused, False otherwise
+    """
+    if remote_size and output_path.stat().st_size != remote_size:
+        return False
+
+    if validator is None:
+        return True
+
+    return etag_file.exists() and etag_file.read_text(encoding="utf-8") == validator
 
 
 def download_file(url: str, output_path: Path) -> bool:
     """Download a file from URL with progress reporting.
 
+    An existing file is reused only if its size and the ETag/Last-Modified value
+    stored in the ``.etag`` sidecar still match the remote file. New downloads
+    are written to a ``.part`` file that replaces the output only on success.
+
     Args:
         url (str): URL to download from
         output_path (Path): Path to save the downloaded file
@@ -358,10 +764,6 @@ def download_file(url: str, output_path: Path) -> bool:
     """
     print(f"Downloading from {url}...")
 
-    if output_path.exists():
-        print(f"File already exists: {output_path.name}")
-        return True
-
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -371,34 +773,59 @@ def download_file(url: str, output_path: Path) -> bool:
         "Accept-Language": "en-US,en;q=0.9",
     }
 
+    etag_file = output_path.with_suffix(output_path.suffix + ".etag")
+    part_path = output_path.with_suffix(output_path.suffix + ".part")
+    validator, remote_size, accepts_ranges = _probe_remote_file(url, headers)
+
+    if output_path.exists():
+        if _is_download_current(output_path, etag_file, validator, remote_size):
+            print(f"File already up to date: {output_path.name}")
+            return True
+
+        print(f"Remote file changed, re-downloading: {output_path.name}")
+        output_path.unlink()
+
+    etag_file.unlink(missing_ok=True)
+    _ACTIVE_DOWNLOADS.add(output_path)
+
     try:
-        with requests.get(url, stream=True, headers=headers, timeout=60) as r:
+        if accepts_ranges and remote_size >= SEGMENTED_DOWNLOAD_MIN_SIZE:
+            if _download_segmented(url, headers, part_path, remote_size):
+                os.replace(part_path, output_path)
+                _save_etag(etag_file, validator)
+                return True
+
+            print("Server ignored range requests, falling back to a single stream")
+
+        with _SESSION.get(url, stream=True, headers=headers, timeout=60) as r:
             r.raise_for_status()
 
+            validator = validator or r.headers.get("ETag") or r.headers.get("Last-Modified")
             total_size = int(r.headers.get("content-length", 0))
-            downloaded_size = 0
             is_github_actions = bool(os.getenv("GITHUB_ACTIONS"))
-            last_progress_logged = -1
 
-            with output_path.open("wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        last_progress_logged = _show_download_progress(
-                            downloaded_size, total_size, last_progress_logged, is_github_actions
-                        )
+            r.raw.decode_content = True
+
+            with part_path.open("wb") as f:
+                if is_github_actions and total_size == 0:
+                    shutil.copyfileobj(r.raw, f, DOWNLOAD_CHUNK_SIZE)
+                else:
+                    reporter = _ProgressReporter(total_size, is_github_actions, output_path.name)
+                    shutil.copyfileobj(_ProgressReader(r.raw, reporter), f, DOWNLOAD_CHUNK_SIZE)
+                    reporter.finish()
 
-            if not is_github_actions:
-                print()
+        os.replace(part_path, output_path)
+        _save_etag(etag_file, validator)
         return True
 
-    except requests.RequestException as e:
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
         print(f"Error downloading file: {e}", file=sys.stderr)
-        if output_path.exists():
-            output_path.unlink()
+        part_path.unlink(missing_ok=True)
         return False
 
+    finally:
+        _ACTIVE_DOWNLOADS.discard(output_path)
+
 
 def download_gdk_package(download_url: str, base_dir: Path, version: str) -> Path | None:
     """Download GDK package (msixvc) from direct URL.
@@ -438,22 +865,26 @@ def _process_extracted_lang_files(
     """
     print(f"Processing language files from {resource_packs_dir}...")
 
+    cache_dir = base_output_dir.parent / JSON_CACHE_DIR_NAME
     found_any = False
 
-    for pack_dir in resource_packs_dir.iterdir():
-        if not pack_dir.is_dir():
-            continue
+    with os.scandir(resource_packs_dir) as it:
+        pack_dirs = [entry for entry in it if entry.is_dir()]
 
-        texts_dir = pack_dir / "texts"
-        if not texts_dir.exists():
+    for pack_dir in pack_dirs:
+        try:
+            with os.scandir(os.path.join(pack_dir.path, "texts")) as it:
+                lang_files = {entry.name: entry for entry in it if entry.is_file()}
+        except FileNotFoundError:
             continue
 
         for lang_file_name in target_languages:
-            lang_file = texts_dir / lang_file_name
-            if not lang_file.exists():
+            lang_file = lang_files.get(lang_file_name)
+            if lang_file is None:
                 continue
 
-            raw_content = lang_file.read_text(encoding="utf-8", errors="ignore")
+            with open(lang_file.path, encoding="utf-8", errors="ignore") as f:
+                raw_content = f.read()
             cleaned_content = clean_lang_content(raw_content)
 
             if not cleaned_content:
@@ -462,7 +893,7 @@ def _process_extracted_lang_files(
             relative_path = f"{pack_dir.name}/{lang_file_name}"
             output_file = base_output_dir / relative_path
 
-            if _save_lang_and_json(cleaned_content, output_file, relative_path):
+            if _save_lang_and_json(cleaned_content, output_file, relative_path, cache_dir):
                 found_any = True
 
     return found_any
@@ -549,17 +980,22 @@ def process_gdk_package(msixvc_file: Path, base_output_dir: Path) -> bool:
     xvd_cik_dir = xvdtool_working_dir / "Cik"
     xvd_cik_dir.mkdir(exist_ok=True)
 
-    cik_files_copied = 0
-    for cik_file in cik_dir.glob("*.cik"):
+    copied_ciks: list[str] = []
+    for cik_file in cik_files:
         dest_cik = xvd_cik_dir / cik_file.name
-        shutil.copy2(cik_file, dest_cik)
-        print(f"Copied CIK: {cik_file.name}")
-        cik_files_copied += 1
+        dest_cik.unlink(missing_ok=True)
+        try:
+            os.link(cik_file, dest_cik)
+        except OSError:
+            shutil.copyfile(cik_file, dest_cik)
+        copied_ciks.append(cik_file.name)
 
-    if cik_files_copied == 0:
+    if not copied_ciks:
         print("Warning: No CIK files found to copy")
         return False
 
+    print(f"Copied CIKs: {', '.join(copied_ciks)}")
+
     try:
         result = subprocess.run(
             [
@@ -634,6 +1070,72 @@ def process_gdk_package(msixvc_file: Path, base_output_dir: Path) -> bool:
     return True
 
 
+def _is_version_extracted(package_output_dir: Path, version: str) -> bool:
+    """Check whether a package version has been successfully extracted.
+
+    Args:
+        package_output_dir (Path): Output directory of the package
+        version (str): Version to check
+
+    Returns:
+        bool: True if the last successful extraction recorded this version
+    """
+    version_file = package_output_dir / EXTRACTED_VERSION_FILE_NAME
+    try:
+        return version_file.read_text(encoding="utf-8").strip() == version
+    except FileNotFoundError:
+        return False
+
+
+def _fetch_package(
+    package: PackageInfo, base_dir: Path, output_dir: Path
+) -> tuple[str, Path | None, str] | None:
+    """Look up the latest version of a package and download it.
+
+    The download is skipped if the version was already extracted successfully
+    by a previous run.
+
+    Args:
+        package (PackageInfo): The package to fetch
+        base_dir (Path): Base directory to save the downloaded file
+        output_dir (Path): Output directory for extracted files
+
+    Returns:
+        tuple[str, Path | None, str] | None: (version, package_file, build_type)
+            package_file is None if the download failed or was skipped
+            Returns None if the version info could not be retrieved
+    """
+    package_type = package["package_type"]
+    version_data = get_latest_version_from_api(package_type)
+
+    if not version_data:
+        print(f"Failed to get version info for {package_type}")
+        return None
+
+    version, build_type, download_info = version_data
+
+    if _is_version_extracted(output_dir / package["folder_name"], version):
+        print(f"{package_type} {version} is already extracted, skipping download")
+        return (version, None, build_type)
+
+    package_file: Path | None = None
+
+    if build_type == "UWP":
+        package_file = get_appx_file(download_info, base_dir)
+    elif build_type == "GDK":
+        package_file = download_gdk_package(download_info, base_dir, version)
+    else:
+        print(f"Unknown build type: {build_type}")
+        return (version, None, build_type)
+
+    if not package_file:
+        print(f"Failed to download package for {package_type}")
+        return (version, None, build_type)
+
+    print(f"Downloaded: {package_file.name}")
+    return (version, package_file, build_type)
+
+
 def main() -> None:
     """Main entry point for the language file extractor."""
     script_dir = Path(__file__).parent
@@ -646,7 +1148,18 @@ def main() -> None:
     print(f"Base directory: {base_dir}")
     print(f"Output directory: {output_dir}")
 
-    package_files: list[tuple[str, Path, str]] = []
+    versions_file = base_dir / "versions.json"
+
+    existing_version_data = {}
+    if versions_file.exists():
+        try:
+            existing_version_data = orjson.loads(versions_file.read_bytes())
+        except Exception as e:
+            print(f"Warning: Could not read existing versions.json: {e}")
+
+    existing_versions = existing_version_data.get("versions", {})
+
+    package_files: list[tuple[str, Path, str, str]] = []
     version_info: dict[str, str | None] = {"release": None, "development": None}
 
     max_retries = 5
@@ -655,46 +1168,36 @@ def main() -> None:
     while retry_count < max_retries:
         version_info = {"release": None, "development": None}
 
-        for i, package in enumerate(PACKAGE_INFO):
-            prefix = "\n" if i == 0 else "\n\n"
-            package_type = package["package_type"]
-            folder_name = package["folder_name"]
-
-            if retry_count > 0:
-                attempt_msg = f"(Attempt {retry_count + 1}/{max_retries})"
-                print(f"{prefix}Retrying package type: {package_type} {attempt_msg}")
-            else:
-                print(f"{prefix}Processing package type: {package_type}")
-
-            version_data = get_latest_version_from_api(package_type)
-
-            if not version_data:
-                print(f"Failed to get version info for {package_type}")
-                continue
-
-            version, build_type, download_info = version_data
+        package_types = ", ".join(package["package_type"] for package in PACKAGE_INFO)
 
-            if folder_name == "release":
-                version_info["release"] = version
-            else:
-                version_info["development"] = version
-
-            package_file: Path | None = None
-
-            if build_type == "UWP":
-                package_file = get_appx_file(download_info, base_dir)
-            elif build_type == "GDK":
-                package_file = download_gdk_package(download_info, base_dir, version)
-            else:
-                print(f"Unknown build type: {build_type}")
-                continue
+        if retry_count > 0:
+            attempt_msg = f"(Attempt {retry_count + 1}/{max_retries})"
+            print(f"\nRetrying package types: {package_types} {attempt_msg}")
+        else:
+            print(f"\nProcessing package types: {package_types}")
+
+        with ThreadPoolExecutor(max_workers=len(PACKAGE_INFO)) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_package,
+                    package,
+                    base_dir,
+                    output_dir,
+                ): package
+                for package in PACKAGE_INFO
+            }
+
+            for future in as_completed(futures):
+                fetched = future.result()
+                if fetched is None:
+                    continue
 
-            if not package_file:
-                print(f"Failed to download package for {package_type}")
-                continue
+                folder_name = futures[future]["folder_name"]
+                version, package_file, build_type = fetched
+                version_info[folder_name] = version
 
-            print(f"Downloaded: {package_file.name}")
-            package_files.append((folder_name, package_file, build_type))
+                if package_file:
+                    package_files.append((folder_name, package_file, build_type, version))
 
         if version_info["release"] is not None and version_info["development"] is not None:
             break
@@ -712,16 +1215,6 @@ def main() -> None:
         sys.exit(1)
 
     print("\n" + "=" * 60)
-    versions_file = base_dir / "versions.json"
-
-    existing_version_data = {}
-    if versions_file.exists():
-        try:
-            existing_version_data = orjson.loads(versions_file.read_bytes())
-        except Exception as e:
-            print(f"Warning: Could not read existing versions.json: {e}")
-
-    existing_versions = existing_version_data.get("versions", {})
     versions_changed = existing_versions != version_info
 
     if versions_changed:
@@ -730,19 +1223,29 @@ def main() -> None:
             "versions": version_info,
         }
 
-        tmp_file = versions_file.with_suffix(versions_file.suffix + ".tmp")
-        tmp_file.write_bytes(orjson.dumps(version_data_to_save, option=orjson.OPT_INDENT_2))
-        tmp_file.replace(versions_file)
+        versions_bytes = orjson.dumps(
+            version_data_to_save, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+
+        tmp_versions_file = versions_file.with_suffix(".json.tmp")
+        with tmp_versions_file.open("wb") as f:
+            f.write(versions_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_versions_file, versions_file)
 
     print("Version information saved:")
     print(f"  Release: {version_info.get('release', 'N/A')}")
     print(f"  Development: {version_info.get('development', 'N/A')}")
 
-    for folder_name, package_file, build_type in package_files:
+    for folder_name, package_file, build_type, version in package_files:
         print("\n" + "=" * 60)
         package_output_dir = output_dir / folder_name
         package_output_dir.mkdir(exist_ok=True)
 
+        version_file = package_output_dir / EXTRACTED_VERSION_FILE_NAME
+        version_file.unlink(missing_ok=True)
+
         if build_type == "GDK":
             success = process_gdk_package(package_file, package_output_dir)
         else:
@@ -751,9 +1254,13 @@ def main() -> None:
                 package_file, package_output_dir, TARGET_LANGUAGES, exclude_beta
             )
 
-        if not success:
+        if success:
+            version_file.write_text(f"{version}\n", encoding="utf-8")
+        else:
             print(f"Failed to process package: {package_file}")
 
+    _prune_json_cache(output_dir / JSON_CACHE_DIR_NAME)
+
     print("\n" + "=" * 60)
     print("Language file extraction completed!")
     print(f"Output directory: {output_dir}")
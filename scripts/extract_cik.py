@@ -14,10 +14,24 @@ Requirements:
     - CikExtractor.exe in tools/CikExtractor/ directory
 """
 
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+MINECRAFT_PACKAGE_MARKER: str = "microsoft.minecraftwindowsbeta_8wekyb3d8bbwe"
+
+GUID_SEARCH_WINDOW: int = 9
+
+HEX_UPPERCASE_TABLE: dict[int, int] = str.maketrans("abcdef", "ABCDEF")
+
+MINECRAFT_GUID_PATTERN: re.Pattern[str] = re.compile(
+    r"└── \?\?.*\s([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\s*$",
+    re.IGNORECASE,
+)
+
 
 def extract_cik_keys(tools_dir: Path, cik_output_dir: Path) -> bool:
     """Extract CIK keys using CikExtractor.
@@ -54,45 +68,58 @@ def extract_cik_keys(tools_dir: Path, cik_output_dir: Path) -> bool:
     cikextractor_dir = cikextractor_exe.parent
 
     try:
-        result = subprocess.run(
-            [str(cikextractor_exe), "dump", "-c", str(cik_output_dir.absolute())],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=str(cikextractor_dir),
-        )
-
-        print(f"\nCikExtractor return code: {result.returncode}")
-
-        if result.stdout:
-            print("\nCikExtractor output:")
-            print(result.stdout)
-
-        if result.stderr:
+        with (
+            subprocess.Popen(
+                [str(cikextractor_exe), "dump", "-c", str(cik_output_dir.absolute())],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                cwd=str(cikextractor_dir),
+            ) as process,
+            ThreadPoolExecutor(max_workers=1) as stderr_reader,
+        ):
+            stderr_future = stderr_reader.submit(process.stderr.read)
+
+            minecraft_guid = None
+            lines_since_marker = None
+
+            try:
+                print("\nCikExtractor output:")
+                for line in process.stdout:
+                    print(line, end="")
+
+                    if minecraft_guid is not None:
+                        continue
+                    if lines_since_marker is None:
+                        if MINECRAFT_PACKAGE_MARKER in line.lower():
+                            lines_since_marker = 0
+                    elif lines_since_marker < GUID_SEARCH_WINDOW:
+                        lines_since_marker += 1
+                        guid_match = MINECRAFT_GUID_PATTERN.search(line)
+                        if guid_match:
+                            minecraft_guid = guid_match.group(1)
+            except BaseException:
+                process.kill()
+                raise
+
+            returncode = process.wait()
+            stderr_output = stderr_future.result()
+
+        print(f"\nCikExtractor return code: {returncode}")
+
+        if stderr_output:
             print("\nCikExtractor errors:")
-            print(result.stderr)
+            print(stderr_output)
 
-        if result.returncode != 0:
-            print(f"\nCikExtractor failed with error code {result.returncode}")
+        if returncode != 0:
+            print(f"\nCikExtractor failed with error code {returncode}")
             return False
 
-        minecraft_guid = None
-        if result.stdout:
-            lines = result.stdout.splitlines()
-            for i, line in enumerate(lines):
-                if "microsoft.minecraftwindowsbeta_8wekyb3d8bbwe" in line.lower():
-                    for j in range(i + 1, min(i + 10, len(lines))):
-                        next_line = lines[j]
-                        if "└── ??" in next_line or "    └── ??" in next_line:
-                            parts = next_line.strip().split()
-                            if len(parts) >= 2:
-                                guid_candidate = parts[-1]
-                                if "-" in guid_candidate and len(guid_candidate) > 30:
-                                    minecraft_guid = guid_candidate
-                                    break
-                    break
-
-        cik_files = list(cik_output_dir.glob("*.cik"))
+        with os.scandir(cik_output_dir) as it:
+            cik_files = [
+                Path(entry.path) for entry in it if entry.is_file() and entry.name.endswith(".cik")
+            ]
         if not cik_files:
             print("\nWarning: No CIK files were extracted")
             return False
@@ -114,8 +141,7 @@ def extract_cik_keys(tools_dir: Path, cik_output_dir: Path) -> bool:
             print("GitHub Actions Secrets Configuration")
             print("=" * 60)
 
-            cik_bytes = minecraft_cik.read_bytes()
-            cik_hex = cik_bytes.hex().upper()
+            cik_hex = minecraft_cik.read_bytes().hex().translate(HEX_UPPERCASE_TABLE)
             cik_guid = minecraft_cik.stem
 
             print(f"\nMinecraft CIK file: {minecraft_cik.name}")
@@ -140,6 +166,11 @@ def extract_cik_keys(tools_dir: Path, cik_output_dir: Path) -> bool:
 
 def main() -> None:
     """Main entry point for CIK key extraction."""
+    if sys.platform != "win32":
+        print("Error: CIK extraction requires Windows")
+        print("CikExtractor is a Windows-only tool")
+        sys.exit(1)
+
     script_dir = Path(__file__).parent
     base_dir = script_dir.parent
 
@@ -153,8 +184,6 @@ def main() -> None:
     print(f"Tools directory: {tools_dir}")
     print(f"CIK output directory: {cik_dir}")
 
-    tools_dir.mkdir(exist_ok=True)
-
     success = extract_cik_keys(tools_dir, cik_dir)
 
     print("\n" + "=" * 60)
@@ -11,56 +11,141 @@ The module supports multiple branches (release, beta, preview) with different
 versioning schemes and automatically organizes output files in the packed directory.
 """
 
-import json
-import shutil
+import io
+import os
+import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TypedDict
 
+import orjson
 from convert import extract_translation_with_sources, save_lang_file_with_sources
 
+PACK_COMPRESS_LEVEL: int = 1
 
-def create_pack_archive(branch: str, lang_files: list[Path], version: str) -> None:
+
+class PackResources(TypedDict):
+    """Shared files included in every resource pack.
+
+    Attributes:
+        manifest (bytes): Contents of resources/manifest.json
+        texts (dict[str, bytes]): Contents of the resources/texts JSON files, keyed by file name
+    """
+
+    manifest: bytes
+    texts: dict[str, bytes]
+
+
+def load_pack_resources() -> PackResources:
+    """Read the shared resource pack files once.
+
+    Returns:
+        PackResources: Manifest and language JSON file contents
+    """
+    texts: dict[str, bytes] = {}
+    languages_dir = Path("resources/texts")
+    if languages_dir.exists():
+        for json_file in languages_dir.glob("*.json"):
+            texts[json_file.name] = json_file.read_bytes()
+
+    return {"manifest": Path("resources/manifest.json").read_bytes(), "texts": texts}
+
+
+def create_pack_archive(
+    branch: str, lang_files: list[Path], version: str, resources: PackResources
+) -> None:
     """Create zip and mcpack files for a branch.
 
     Args:
         branch (str): The branch name (e.g., "release", "beta", "preview")
         lang_files (list[Path]): List of language file paths to include
         version (str): Version string for the pack filename
+        resources (PackResources): Shared manifest and language JSON contents
     """
     output_dir = Path("packed")
     output_dir.mkdir(exist_ok=True)
 
-    pack_dir = output_dir / f"temp_{branch}"
-    pack_dir.mkdir(parents=True, exist_ok=True)
+    base_name = f"MCBE_Chinese_Patch_{branch}_{version}"
+    zip_path = output_dir / f"{base_name}.zip"
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(
+        archive,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        allowZip64=False,
+        compresslevel=PACK_COMPRESS_LEVEL,
+    ) as zipf:
+        zipf.writestr("manifest.json", resources["manifest"])
+
+        for lang_file in lang_files:
+            zipf.write(lang_file, f"texts/{lang_file.name}")
+
+        for json_name, json_bytes in resources["texts"].items():
+            zipf.writestr(f"texts/{json_name}", json_bytes)
 
+    archive_bytes = archive.getvalue()
+    zip_path.write_bytes(archive_bytes)
+
+    mcpack_path = zip_path.with_suffix(".mcpack")
+    mcpack_path.unlink(missing_ok=True)
     try:
-        shutil.copy2("resources/manifest.json", pack_dir / "manifest.json")
+        os.link(zip_path, mcpack_path)
+    except OSError:
+        mcpack_path.write_bytes(archive_bytes)
 
-        texts_dir = pack_dir / "texts"
-        texts_dir.mkdir(exist_ok=True)
+    print(f"Created {base_name}.zip (.mcpack)")
 
-        for lang_file in lang_files:
-            shutil.copy2(lang_file, texts_dir / lang_file.name)
 
-        languages_dir = Path("resources/texts")
-        if languages_dir.exists():
-            for json_file in languages_dir.glob("*.json"):
-                shutil.copy2(json_file, texts_dir / json_file.name)
+def process_branch(
+    branch_dir: Path, extracted_dir: Path, versions: dict[str, str], resources: PackResources
+) -> None:
+    """Convert a branch's TSV files to lang format and pack them.
+
+    Args:
+        branch_dir (Path): Branch directory under patched/ (e.g., patched/beta)
+        extracted_dir (Path): Directory containing the extracted game language files
+        versions (dict[str, str]): Version strings keyed by "release" and "development"
+        resources (PackResources): Shared manifest and language JSON contents
+    """
+    print(f"Processing branch: {branch_dir.name}")
+
+    tsv_files: list[Path] = []
+    lang_files_by_name: dict[str, Path] = {}
+    with os.scandir(branch_dir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".tsv"):
+                tsv_files.append(Path(entry.path))
+            elif entry.name.endswith(".lang"):
+                lang_files_by_name[entry.name] = Path(entry.path)
+
+    for tsv_file in tsv_files:
+        print(f"  Converting {tsv_file.name}")
+
+        sources_data = extract_translation_with_sources(tsv_file, extracted_dir, branch_dir.name)
+
+        output_lang_file = tsv_file.with_suffix(".lang")
+        save_lang_file_with_sources(output_lang_file, sources_data)
+        lang_files_by_name[output_lang_file.name] = output_lang_file
 
-        base_name = f"MCBE_Chinese_Patch_{branch}_{version}"
-        zip_path = output_dir / f"{base_name}.zip"
+    branch = branch_dir.name.capitalize()
+    lang_files = list(lang_files_by_name.values())
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in pack_dir.rglob("*"):
-                if file_path.is_file():
-                    zipf.write(file_path, file_path.relative_to(pack_dir))
+    if not lang_files:
+        print(f"No lang files found for {branch}, skipping...")
+        return
+
+    print(f"Packing branch: {branch}")
 
-        shutil.copy2(zip_path, output_dir / f"{base_name}.mcpack")
-        print(f"Created {base_name}.zip (.mcpack)")
+    if branch.lower() == "release":
+        version = versions["release"]
+    else:
+        version = versions["development"]
 
-    finally:
-        if pack_dir.exists():
-            shutil.rmtree(pack_dir)
+    create_pack_archive(branch, lang_files, version, resources)
 
 
 def main() -> None:
@@ -68,9 +153,9 @@ def main() -> None:
 
     Processes all TSV files in the patched directory, converts them to Minecraft
     lang format with source file organization, and packages them into distributable
-    resource packs for each branch.
+    resource packs for each branch. Branches are processed in parallel worker processes.
     """
-    print("Converting patched TSV files to lang format...")
+    print("Converting patched TSV files to lang format and packing resource packs...")
 
     patched_dir = Path("patched")
     if not patched_dir.exists():
@@ -82,47 +167,29 @@ def main() -> None:
         print("Extracted directory not found!")
         return
 
-    for branch_dir in patched_dir.iterdir():
-        if not branch_dir.is_dir():
-            continue
-
-        print(f"Processing branch: {branch_dir.name}")
-
-        for tsv_file in branch_dir.glob("*.tsv"):
-            print(f"  Converting {tsv_file.name}")
-
-            sources_data = extract_translation_with_sources(
-                tsv_file, extracted_dir, branch_dir.name
+    versions = orjson.loads(Path("versions.json").read_bytes())["versions"]
+    missing_versions = [key for key in ("release", "development") if versions.get(key) is None]
+    if missing_versions:
+        print(f"Missing versions in versions.json: {', '.join(missing_versions)}", file=sys.stderr)
+        sys.exit(1)
+
+    resources = load_pack_resources()
+
+    with os.scandir(patched_dir) as it:
+        branch_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+    if branch_dirs:
+        max_workers = min(len(branch_dirs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    process_branch,
+                    branch_dirs,
+                    [extracted_dir] * len(branch_dirs),
+                    [versions] * len(branch_dirs),
+                    [resources] * len(branch_dirs),
+                )
             )
 
-            output_lang_file = tsv_file.with_suffix(".lang")
-            save_lang_file_with_sources(output_lang_file, sources_data)
-
-    print("\nPacking resource packs...")
-
-    with open("versions.json", encoding="utf-8") as f:
-        versions = json.load(f)["versions"]
-
-    for branch_dir in patched_dir.iterdir():
-        if not branch_dir.is_dir():
-            continue
-
-        branch = branch_dir.name.capitalize()
-        lang_files = list(branch_dir.glob("*.lang"))
-
-        if not lang_files:
-            print(f"No lang files found for {branch}, skipping...")
-            continue
-
-        print(f"Packing branch: {branch}")
-
-        if branch.lower() == "release":
-            version = versions["release"]
-        else:
-            version = versions["development"]
-
-        create_pack_archive(branch, lang_files, version)
-
     print("\nDone!")
 
 
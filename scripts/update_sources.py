@@ -5,6 +5,7 @@ information for Crowdin translation platform integration in TSV format.
 """
 
 import csv
+import io
 import sys
 from pathlib import Path
 
@@ -15,6 +16,8 @@ TARGET_LANGUAGES: list[str] = ["zh_CN.json", "zh_TW.json"]
 
 TARGETS: list[str] = ["release", "beta", "preview"]
 
+TSV_BATCH_ROWS: int = 4096
+
 
 def process_target(target: str, base_dir: Path) -> None:
     """Process a single target configuration (release, beta, or preview).
@@ -49,7 +52,7 @@ def process_target(target: str, base_dir: Path) -> None:
             target_content = load_json_file(target_path)
             print(f"  Loaded {len(target_content)} entries from {target_file}")
 
-            lang_code = target_file.replace(".json", "")
+            lang_code = target_file.removesuffix(".json")
             translations[lang_code] = target_content
         except (FileNotFoundError, PermissionError) as e:
             print(f"Warning: Failed to read {target_path}: {e}", file=sys.stderr)
@@ -58,19 +61,33 @@ def process_target(target: str, base_dir: Path) -> None:
     print(f"Writing output file: {output_file}")
 
     try:
-        with open(output_file, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f, delimiter="\t")
-            writer.writerow(["Key", "Source string", "Context", "Translation"])
-
-            for string_id, source_text in source_content.items():
-                context_lines = ["Original Translation"]
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer, delimiter="\t")
+        writer.writerow(["Key", "Source string", "Context", "Translation"])
+
+        source_items = list(source_content.items())
+        context_by_id: dict[str, str] = {}
+        for lang_code, lang_content in translations.items():
+            for string_id, text in lang_content.items():
+                context_by_id[string_id] = (
+                    f"{context_by_id.get(string_id, 'Original Translation')}\n{lang_code}: {text}"
+                )
 
-                for lang_code, lang_content in translations.items():
-                    if string_id in lang_content:
-                        context_lines.append(f"{lang_code}: {lang_content[string_id]}")
-
-                context = "\n".join(context_lines)
-                writer.writerow([string_id, source_text, context])
+        with open(output_file, "w", encoding="utf-8", newline="") as f:
+            for start in range(0, len(source_items), TSV_BATCH_ROWS):
+                writer.writerows(
+                    (
+                        string_id,
+                        source_text,
+                        context_by_id.get(string_id, "Original Translation"),
+                    )
+                    for string_id, source_text in source_items[start : start + TSV_BATCH_ROWS]
+                )
+                f.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate(0)
+
+            f.write(buffer.getvalue())
 
         print(f"Successfully created {output_file} with {len(source_content)} entries")
     except (OSError, PermissionError) as e: